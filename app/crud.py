@@ -9,19 +9,28 @@ Why keep CRUD separate from main.py?
 
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.orm import Session, undefer
 from datetime import date, datetime
-import json
+from typing import Iterator
+import asyncio
+import base64
+import orjson
 
 from . import models
+from .geocache import cached_geocode
+from .tempscache import cached_daily_temps
 from .schemas import RecordCreate, RecordUpdate
-from .weather_clients import OpenWeatherClient, OpenMeteoClient, WeatherError
+from .weather_clients import OpenWeatherClient, OpenMeteoClient, ResolvedLocation, WeatherError
 
 
 # A small cap prevents people from requesting huge date ranges,
 # keeps API calls fast, and avoids storing overly large blobs in SQLite.
 MAX_RANGE_DAYS = 16
 
+# Same idea for bulk creates: each record costs upstream API calls.
+MAX_BULK_RECORDS = 100
+
 
 def validate_date_range(start: date, end: date) -> None:
     """
@@ -35,6 +44,35 @@ def validate_date_range(start: date, end: date) -> None:
         raise WeatherError(f"Date range too large. Please use <= {MAX_RANGE_DAYS} days.")
 
 
+def _persist(db: Session, *records: models.WeatherQuery) -> None:
+    """
+    Blocking part of a write: add + commit (fsync) + reload.
+
+    The async CRUD functions run this via asyncio.to_thread so a slow SQLite
+    commit doesn't stall the event loop for every other in-flight request.
+    """
+    db.add_all(records)
+    db.flush()
+    ids = [r.id for r in records]
+    db.commit()
+    _reload(db, ids)
+
+
+def _reload(db: Session, ids: list[int]) -> list[models.WeatherQuery]:
+    """
+    Re-read freshly committed rows in one SELECT, including the deferred
+    daily_temps_json (callers serialize it right away). Instances already in
+    the session are refreshed in place.
+    """
+    return db.scalars(
+        select(models.WeatherQuery)
+        .options(undefer(models.WeatherQuery.daily_temps_json))
+        .where(models.WeatherQuery.id.in_(ids))
+        .order_by(models.WeatherQuery.id)
+        .execution_options(populate_existing=True)
+    ).all()
+
+
 async def create_record(db: Session, payload: RecordCreate, owm: OpenWeatherClient, om: OpenMeteoClient) -> models.WeatherQuery:
     """
     CREATE record:
@@ -45,10 +83,9 @@ async def create_record(db: Session, payload: RecordCreate, owm: OpenWeatherClie
     """
     validate_date_range(payload.start_date, payload.end_date)
 
-    resolved = await owm.geocode(payload.location)
-    temps = await om.daily_temps(resolved.lat, resolved.lon, payload.start_date, payload.end_date)
+    resolved = await cached_geocode(owm, payload.location)
+    temps = await cached_daily_temps(om, resolved.lat, resolved.lon, payload.start_date, payload.end_date)
 
-    now = datetime.utcnow()
     record = models.WeatherQuery(
         location_input=payload.location,
         resolved_name=resolved.name,
@@ -58,31 +95,177 @@ async def create_record(db: Session, payload: RecordCreate, owm: OpenWeatherClie
         lon=resolved.lon,
         start_date=payload.start_date,
         end_date=payload.end_date,
-        daily_temps_json=json.dumps(temps),
-        created_at=now,
-        updated_at=now,
+        daily_temps_json=orjson.dumps(temps).decode(),
     )
 
-    db.add(record)
-    db.commit()
-    db.refresh(record)
+    await asyncio.to_thread(_persist, db, record)
     return record
 
 
-def list_records(db: Session, limit: int = 100, offset: int = 0):
-    """List records with basic pagination."""
-    return (
-        db.query(models.WeatherQuery)
-        .order_by(models.WeatherQuery.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+def _insert_many(db: Session, rows: list[dict]) -> list[models.WeatherQuery]:
+    """One executemany INSERT ... RETURNING and a single commit for N rows."""
+    ids = db.scalars(insert(models.WeatherQuery).returning(models.WeatherQuery.id), rows).all()
+    db.commit()
+    return _reload(db, ids)
+
+
+async def bulk_create(db: Session, payloads: list[RecordCreate], owm: OpenWeatherClient, om: OpenMeteoClient) -> list[models.WeatherQuery]:
+    """
+    CREATE many records at once:
+    - validate every date range up front (all-or-nothing)
+    - geocode each distinct location once, concurrently
+    - fetch daily temps for all records concurrently
+    - store everything in one transaction (1 commit instead of N)
+    """
+    if len(payloads) > MAX_BULK_RECORDS:
+        raise WeatherError(f"Too many records. Please send <= {MAX_BULK_RECORDS} per request.")
+
+    for p in payloads:
+        validate_date_range(p.start_date, p.end_date)
+
+    locations = list(dict.fromkeys(p.location for p in payloads))
+    resolved_list = await asyncio.gather(*[cached_geocode(owm, loc) for loc in locations])
+    resolved_by_location = dict(zip(locations, resolved_list))
+
+    all_temps = await asyncio.gather(*[
+        cached_daily_temps(
+            om,
+            resolved_by_location[p.location].lat,
+            resolved_by_location[p.location].lon,
+            p.start_date,
+            p.end_date,
+        )
+        for p in payloads
+    ])
+
+    rows = []
+    for p, temps in zip(payloads, all_temps):
+        resolved = resolved_by_location[p.location]
+        rows.append({
+            "location_input": p.location,
+            "resolved_name": resolved.name,
+            "country": resolved.country,
+            "state": resolved.state,
+            "lat": resolved.lat,
+            "lon": resolved.lon,
+            "start_date": p.start_date,
+            "end_date": p.end_date,
+            "daily_temps_json": orjson.dumps(temps).decode(),
+        })
+
+    if not rows:
+        return []
+    return await asyncio.to_thread(_insert_many, db, rows)
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """Opaque pagination cursor pointing just past the (created_at, id) row."""
+    raw = f"{created_at.isoformat()}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of encode_cursor -> (created_at, id)."""
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(record_id)
+    except ValueError:
+        raise WeatherError("Invalid pagination cursor.")
+
+
+def _newest_first(before: tuple[datetime, int] | None):
+    """
+    Keyset pagination clauses: rows strictly after the `before` cursor,
+    newest first.
+
+    Instead of OFFSET (which walks every skipped row), we resume from the
+    (created_at, id) of the last row of the previous page, so every page is
+    an index seek regardless of depth.
+    """
+    m = models.WeatherQuery
+    where = []
+    if before is not None:
+        created_at, record_id = before
+        where.append(or_(m.created_at < created_at, and_(m.created_at == created_at, m.id < record_id)))
+    return where, (m.created_at.desc(), m.id.desc())
+
+
+def list_records(db: Session, limit: int = 100, before: tuple[datetime, int] | None = None):
+    """List full ORM records, newest first, with keyset pagination."""
+    where, order_by = _newest_first(before)
+    return db.query(models.WeatherQuery).filter(*where).order_by(*order_by).limit(limit).all()
+
+
+# Everything except daily_temps_json: what list views actually display.
+_SUMMARY_COLUMNS = (
+    models.WeatherQuery.id,
+    models.WeatherQuery.location_input,
+    models.WeatherQuery.resolved_name,
+    models.WeatherQuery.country,
+    models.WeatherQuery.state,
+    models.WeatherQuery.lat,
+    models.WeatherQuery.lon,
+    models.WeatherQuery.start_date,
+    models.WeatherQuery.end_date,
+    models.WeatherQuery.created_at,
+    models.WeatherQuery.updated_at,
+)
+
+
+def list_records_summary(db: Session, limit: int = 100, before: tuple[datetime, int] | None = None):
+    """
+    Like list_records, but a plain column projection: returns dict-like rows
+    instead of hydrated ORM objects, and never reads daily_temps_json.
+    """
+    where, order_by = _newest_first(before)
+    stmt = select(*_SUMMARY_COLUMNS).where(*where).order_by(*order_by).limit(limit)
+    return db.execute(stmt).mappings().all()
+
+
+def iter_all_records(
+    db: Session,
+    max_rows: int = 10000,
+    chunk: int = 200,
+    with_temps: bool = True,
+) -> Iterator[models.WeatherQuery]:
+    """
+    Iterate records newest first (used by exports).
+
+    Rows are streamed from SQLite `chunk` at a time (server-side cursor +
+    yield_per), so memory stays flat no matter how many rows are exported.
+    with_temps=False leaves daily_temps_json unloaded for callers that don't need it.
+    """
+    stmt = select(models.WeatherQuery)
+    if with_temps:
+        stmt = stmt.options(undefer(models.WeatherQuery.daily_temps_json))
+
+    stmt = (
+        stmt.order_by(models.WeatherQuery.created_at.desc(), models.WeatherQuery.id.desc())
+        .limit(max_rows)
+        .execution_options(yield_per=chunk, stream_results=True)
     )
+    yield from db.execute(stmt).scalars()
+
+
+def records_version(db: Session) -> tuple[datetime | None, int]:
+    """
+    Cheap "has anything changed?" fingerprint for the records table:
+    (latest updated_at, row count). Any create/update/delete changes it.
+    """
+    latest, count = db.execute(
+        select(func.max(models.WeatherQuery.updated_at), func.count(models.WeatherQuery.id))
+    ).one()
+    return latest, count
 
 
 def get_record(db: Session, record_id: int) -> models.WeatherQuery | None:
-    """Fetch a single record by id."""
-    return db.query(models.WeatherQuery).filter(models.WeatherQuery.id == record_id).first()
+    """Fetch a single record by id (including its daily temps)."""
+    return (
+        db.query(models.WeatherQuery)
+        .options(undefer(models.WeatherQuery.daily_temps_json))
+        .filter(models.WeatherQuery.id == record_id)
+        .first()
+    )
 
 
 async def update_record(db: Session, record: models.WeatherQuery, payload: RecordUpdate, owm: OpenWeatherClient, om: OpenMeteoClient) -> models.WeatherQuery:
@@ -90,8 +273,8 @@ async def update_record(db: Session, record: models.WeatherQuery, payload: Recor
     UPDATE record:
     - determine updated values
     - validate date range
-    - re-geocode location if changed
-    - re-fetch daily temps for new values
+    - re-geocode location only if it actually changed
+    - re-fetch daily temps only if coordinates or dates changed
     - persist
     """
     location = payload.location if payload.location is not None else record.location_input
@@ -100,8 +283,28 @@ async def update_record(db: Session, record: models.WeatherQuery, payload: Recor
 
     validate_date_range(start, end)
 
-    resolved = await owm.geocode(location)
-    temps = await om.daily_temps(resolved.lat, resolved.lon, start, end)
+    if payload.location is None or payload.location.strip() == record.location_input.strip():
+        # Location unchanged: reuse the stored resolution, no geocoding call.
+        resolved = ResolvedLocation(
+            name=record.resolved_name,
+            country=record.country,
+            state=record.state,
+            lat=record.lat,
+            lon=record.lon,
+        )
+    else:
+        resolved = await cached_geocode(owm, location)
+
+    unchanged = (
+        (resolved.lat, resolved.lon, start, end)
+        == (record.lat, record.lon, record.start_date, record.end_date)
+    )
+    if unchanged:
+        # Same place + same range -> same temps; keep the stored blob.
+        temps_json = record.daily_temps_json
+    else:
+        temps = await cached_daily_temps(om, resolved.lat, resolved.lon, start, end)
+        temps_json = orjson.dumps(temps).decode()
 
     record.location_input = location
     record.resolved_name = resolved.name
@@ -111,15 +314,34 @@ async def update_record(db: Session, record: models.WeatherQuery, payload: Recor
     record.lon = resolved.lon
     record.start_date = start
     record.end_date = end
-    record.daily_temps_json = json.dumps(temps)
-    record.updated_at = datetime.utcnow()
+    record.daily_temps_json = temps_json
+    # Explicit so a no-op update still counts as "touched" (onupdate only
+    # fires when some other column actually changed).
+    record.updated_at = models.db_now()
 
-    db.add(record)
-    db.commit()
-    db.refresh(record)
+    await asyncio.to_thread(_persist, db, record)
     return record
 
 
+async def refresh_many(db: Session, records: list[models.WeatherQuery], om: OpenMeteoClient) -> list[models.WeatherQuery]:
+    """
+    Re-fetch daily temps for several records at once.
+
+    Upstream calls run concurrently (wall time ~ slowest call, not the sum),
+    and everything is persisted in a single commit.
+    """
+    all_temps = await asyncio.gather(*[
+        cached_daily_temps(om, r.lat, r.lon, r.start_date, r.end_date) for r in records
+    ])
+
+    for record, temps in zip(records, all_temps):
+        record.daily_temps_json = orjson.dumps(temps).decode()
+        record.updated_at = models.db_now()
+
+    await asyncio.to_thread(_persist, db, *records)
+    return records
+
+
 def delete_record(db: Session, record: models.WeatherQuery) -> None:
     """DELETE record."""
     db.delete(record)
@@ -6,7 +6,7 @@ We intentionally use SQLite because:
 - It satisfies persistence requirements for the assessment
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from .settings import settings
 
@@ -18,6 +18,25 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
 )
 
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _connection_record):
+    """
+    Per-connection SQLite tuning:
+    - WAL: commits append to a log instead of rewriting pages, and readers
+      don't block on a writer
+    - synchronous=NORMAL: safe with WAL, avoids an fsync on every commit
+    - temp tables, page cache and memory-mapped reads sized for a small app
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=134217728")  # 128 MiB
+    cur.execute("PRAGMA cache_size=-20000")  # ~20 MB (negative = KiB)
+    cur.close()
+
+
 # Session factory used by dependency injection
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -27,6 +46,31 @@ class Base(DeclarativeBase):
     pass
 
 
+def init_schema() -> None:
+    """
+    Create missing tables (models must be imported first).
+
+    create_all() skips tables that already exist, including any indexes
+    added to their models later, so we also create missing indexes
+    explicitly. This acts as a tiny migration for existing SQLite files.
+
+    Common case (schema already up to date) is a single sqlite_master read.
+    """
+    expected = {t.name for t in Base.metadata.sorted_tables}
+    expected |= {i.name for t in Base.metadata.sorted_tables for i in t.indexes}
+    with engine.connect() as conn:
+        existing = set(conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+        ).scalars())
+    if expected <= existing:
+        return
+
+    Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def get_db():
     """
     FastAPI dependency that yields a DB session per request,
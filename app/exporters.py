@@ -1,78 +1,125 @@
 """
 Export helpers.
 
-We keep exporters small and dependency-free:
-- JSON: pretty printed
+We keep exporters small (orjson is the only dependency):
+- JSON: compact by default, pretty printed on request
 - CSV: 1 row per record (daily temps serialized)
 - Markdown: simple report table
+
+Each format is a generator (iter_export_*) that yields text chunks as records
+are formatted, so large exports can be streamed without building the whole
+document in memory. export_* wrappers return the joined string.
 """
 
 from __future__ import annotations
 import csv
-import io
-import json
-from typing import List, Dict, Any
+import textwrap
+from typing import Any, Dict, Iterable, Iterator, List
 
+import orjson
 
-def export_json(records: List[Dict[str, Any]]) -> str:
-    """Export list of records as pretty JSON."""
-    return json.dumps(records, indent=2, default=str)
 
+def _dumps(value: Any, option: int = 0) -> str:
+    # default=str keeps anything orjson can't serialize natively exportable
+    return orjson.dumps(value, option=option | orjson.OPT_NON_STR_KEYS, default=str).decode()
 
-def export_csv(records: List[Dict[str, Any]]) -> str:
+
+class _LineBuf:
     """
-    Export list of records as CSV.
+    Minimal file-like sink for csv writers.
 
-    We "flatten" records to one row each.
-    daily_temps (list) becomes a JSON string in a cell.
+    csv.writer returns whatever write() returns, so handing the formatted
+    row straight back lets us yield it instead of accumulating a StringIO.
     """
-    output = io.StringIO()
-    if not records:
-        return ""
 
-    fieldnames = list(records[0].keys())
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+    def write(self, line: str) -> str:
+        return line
+
+
+def iter_export_json(records: Iterable[Dict[str, Any]], pretty: bool = False) -> Iterator[str]:
+    """Stream records as a JSON array (2-space indented if `pretty`)."""
+    first = True
+    for r in records:
+        if pretty:
+            item = "\n" + textwrap.indent(_dumps(r, orjson.OPT_INDENT_2), "  ")
+        else:
+            item = _dumps(r)
+        yield ("[" if first else ",") + item
+        first = False
+
+    if first:
+        yield "[]"
+    else:
+        yield "\n]" if pretty else "]"
+
+
+def iter_export_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Stream records as CSV.
 
+    We "flatten" records to one row each.
+    daily_temps (list) becomes a JSON string in a cell.
+    """
+    writer = None
     for r in records:
-        writer.writerow({
-            k: (json.dumps(v) if isinstance(v, (list, dict)) else v)
+        if writer is None:
+            writer = csv.DictWriter(_LineBuf(), fieldnames=list(r.keys()))
+            yield writer.writeheader()
+
+        yield writer.writerow({
+            k: (_dumps(v) if isinstance(v, (list, dict)) else v)
             for k, v in r.items()
         })
 
-    return output.getvalue()
 
-
-def export_markdown(records: List[Dict[str, Any]]) -> str:
+def iter_export_markdown(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
     """
-    Export a simple Markdown report.
+    Stream a simple Markdown report.
 
     We intentionally omit daily_temps from the table to keep it readable.
     """
-    if not records:
-        return "# Weather Records\n\n_No records._\n"
-
     cols = [
         "id", "location_input", "resolved_name", "country", "state",
         "lat", "lon", "start_date", "end_date", "created_at", "updated_at"
     ]
 
-    lines = [
-        "# Weather Records",
-        "",
-        "| " + " | ".join(cols) + " |",
-        "| " + " | ".join(["---"] * len(cols)) + " |",
-    ]
-
+    first = True
     for r in records:
+        if first:
+            yield "\n".join([
+                "# Weather Records",
+                "",
+                "| " + " | ".join(cols) + " |",
+                "| " + " | ".join(["---"] * len(cols)) + " |",
+                "",
+            ])
+            first = False
+
         row = [str(r.get(c, "")) for c in cols]
-        lines.append("| " + " | ".join(row) + " |")
+        yield "| " + " | ".join(row) + " |\n"
+
+    if first:
+        yield "# Weather Records\n\n_No records._\n"
+        return
 
-    lines += [
+    yield "\n".join([
         "",
         "## Notes",
         "- `daily_temps` is available via the record detail endpoint/page.",
         "",
-    ]
+    ])
+
+
+def export_json(records: List[Dict[str, Any]], pretty: bool = False) -> str:
+    """Export list of records as JSON."""
+    return "".join(iter_export_json(records, pretty=pretty))
+
 
-    return "\n".join(lines)
+def export_csv(records: List[Dict[str, Any]]) -> str:
+    """Export list of records as CSV."""
+    return "".join(iter_export_csv(records))
+
+
+def export_markdown(records: List[Dict[str, Any]]) -> str:
+    """Export a simple Markdown report."""
+    return "".join(iter_export_markdown(records))
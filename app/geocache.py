@@ -0,0 +1,142 @@
+"""
+Geocoding cache.
+
+Why cache geocoding?
+- Every create/update/search resolves a location string over the network
+- Users type the same places over and over ("Austin, TX", "10001", ...)
+- Resolved coordinates for a place are effectively static for hours/days
+
+Two layers:
+- in-process LRU with a TTL (fast path, no I/O at all)
+- SQLite table (so cache hits survive restarts)
+
+Concurrent misses for the same key are coalesced into one upstream call.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import asyncio
+import time
+
+from . import models
+from .db import SessionLocal
+from .weather_clients import OpenWeatherClient, ResolvedLocation
+
+
+MAX_SIZE = 2048
+TTL_S = 24 * 60 * 60
+
+# key -> (expires_at (monotonic seconds), resolved location)
+_cache: "OrderedDict[str, tuple[float, ResolvedLocation]]" = OrderedDict()
+
+# key -> lock, so only one coroutine per key goes upstream at a time
+_locks: dict[str, asyncio.Lock] = {}
+
+
+def normalize_key(location: str) -> str:
+    """
+    Case/whitespace-insensitive cache key ("  Austin,  TX " == "austin, tx").
+
+    Surrounding quotes are dropped like geocode() does, so '"Austin, TX"'
+    shares the entry too. casefold() (not lower()) so e.g. "Straße" and
+    "STRASSE" map to the same key.
+    """
+    return " ".join(location.strip().strip("'\"").casefold().split())
+
+
+def _get_fresh(key: str) -> ResolvedLocation | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, resolved = entry
+    if expires_at <= time.monotonic():
+        del _cache[key]
+        return None
+
+    _cache.move_to_end(key)
+    return resolved
+
+
+def _remember(key: str, resolved: ResolvedLocation, ttl_s: float = TTL_S) -> None:
+    _cache[key] = (time.monotonic() + ttl_s, resolved)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_SIZE:
+        _cache.popitem(last=False)
+
+
+def _load_persisted(key: str) -> tuple[ResolvedLocation, float] | None:
+    """Return (location, remaining ttl seconds) from SQLite, if still fresh."""
+    with SessionLocal() as db:
+        row = db.get(models.GeocodeCache, key)
+        if row is None:
+            return None
+
+        age_s = (models.utcnow() - row.cached_at).total_seconds()
+        if age_s >= TTL_S:
+            db.delete(row)
+            db.commit()
+            return None
+
+        resolved = ResolvedLocation(
+            name=row.name,
+            country=row.country,
+            state=row.state,
+            lat=row.lat,
+            lon=row.lon,
+        )
+        return resolved, TTL_S - age_s
+
+
+def _persist(key: str, resolved: ResolvedLocation) -> None:
+    with SessionLocal() as db:
+        db.merge(models.GeocodeCache(
+            key=key,
+            name=resolved.name,
+            country=resolved.country,
+            state=resolved.state,
+            lat=resolved.lat,
+            lon=resolved.lon,
+            cached_at=models.utcnow(),
+        ))
+        db.commit()
+
+
+async def cached_geocode(owm: OpenWeatherClient, location: str, *, reverse: bool = True) -> ResolvedLocation:
+    """
+    Drop-in replacement for `owm.geocode(location, reverse=...)` backed by the cache.
+
+    Failed lookups (WeatherError) are not cached, so users can retry
+    after fixing a typo or when the upstream API recovers.
+    """
+    key = normalize_key(location)
+    if not reverse:
+        # Coordinates resolve to a different (unlabelled) result without reverse lookup.
+        key = "noreverse:" + key
+
+    hit = _get_fresh(key)
+    if hit is not None:
+        return hit
+
+    lock = _locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            # Another coroutine may have filled the cache while we waited.
+            hit = _get_fresh(key)
+            if hit is not None:
+                return hit
+
+            persisted = _load_persisted(key)
+            if persisted is not None:
+                resolved, ttl_s = persisted
+                _remember(key, resolved, ttl_s)
+                return resolved
+
+            resolved = await owm.geocode(location, reverse=reverse)
+            _persist(key, resolved)
+            _remember(key, resolved)
+            return resolved
+    finally:
+        if not lock.locked() and _locks.get(key) is lock:
+            del _locks[key]
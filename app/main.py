@@ -10,52 +10,140 @@ This file focuses on:
 from __future__ import annotations
 
 from fastapi import FastAPI, Request, Depends, HTTPException, Query
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from sqlalchemy.orm import Session
-import json
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import operator
+import os
+import orjson
 
 from .settings import settings
-from .db import Base, engine, get_db
+from .db import SessionLocal, get_db, init_schema
 from . import models
 from .schemas import RecordCreate, RecordUpdate
 from .weather_clients import OpenWeatherClient, OpenMeteoClient, WeatherError
-from .crud import create_record, list_records, get_record, update_record, delete_record
-from .exporters import export_json, export_csv, export_markdown
+from .crud import create_record, bulk_create, list_records_summary, iter_all_records, get_record, update_record, delete_record, encode_cursor, decode_cursor, records_version
+from .geocache import cached_geocode
+from .exporters import iter_export_json, iter_export_csv, iter_export_markdown
 from urllib.parse import quote_plus
 
-# Create tables automatically (simple for assessments).
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title=settings.app_name)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    App startup/shutdown.
+
+    - Create tables (and any newly added indexes) automatically (simple for assessments).
+      Runs here rather than at import time, so importing app.main never
+      touches the DB. Multi-worker deploys can set INIT_SCHEMA=false on all
+      but one worker so only that one runs DDL.
+    - Compile templates before the first request instead of during it.
+    - Open one pooled HTTP client per upstream API for the app's lifetime,
+      so requests reuse keep-alive connections instead of new handshakes.
+    """
+    if settings.init_schema:
+        init_schema()
+
+    for name in _TEMPLATE_NAMES:
+        templates.get_template(name)
+
+    async with OpenWeatherClient(settings.openweather_api_key) as owm, OpenMeteoClient() as om:
+        app.state.owm_client = owm
+        app.state.meteo_client = om
+        yield
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 # Static and template directories for minimal UI.
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
 
-# API clients (constructed once).
-owm = OpenWeatherClient(settings.openweather_api_key)
-om = OpenMeteoClient()
+# Compiled templates are cached on disk, so a fresh process skips re-parsing.
+# auto_reload=False also skips a stat() per render; enable it while editing templates.
+os.makedirs(settings.jinja_cache_dir, exist_ok=True)
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=FileSystemBytecodeCache(directory=settings.jinja_cache_dir),
+    auto_reload=settings.templates_auto_reload,
+))
 
+_TEMPLATE_NAMES = ("index.html", "results.html", "records.html", "record_detail.html")
+
+
+def get_owm(request: Request) -> OpenWeatherClient:
+    """Shared OpenWeather client (created in `lifespan`)."""
+    return request.app.state.owm_client
+
+
+def get_om(request: Request) -> OpenMeteoClient:
+    """Shared Open-Meteo client (created in `lifespan`)."""
+    return request.app.state.meteo_client
+
+
+# Record -> dict conversion runs once per row on list/export paths, so the
+# column reads go through one precomputed attrgetter (a single C call)
+# instead of a dozen instrumented attribute lookups.
+_SUMMARY_FIELDS = (
+    "id", "location_input", "resolved_name", "country", "state", "lat", "lon",
+    "start_date", "end_date", "created_at", "updated_at",
+)
+_FULL_FIELDS = (
+    "id", "location_input", "resolved_name", "country", "state", "lat", "lon",
+    "start_date", "end_date", "daily_temps_json", "created_at", "updated_at",
+)
+# Output keys for the full dict: the parsed "daily_temps" takes the JSON column's place.
+_FULL_KEYS = tuple("daily_temps" if f == "daily_temps_json" else f for f in _FULL_FIELDS)
+_TEMPS_IDX = _FULL_FIELDS.index("daily_temps_json")
+
+_get_summary = operator.attrgetter(*_SUMMARY_FIELDS)
+_get_full = operator.attrgetter(*_FULL_FIELDS)
 
-def record_to_dict(model: models.WeatherQuery) -> dict:
-    """Convert ORM model -> dict for JSON/templates/export."""
-    return {
-        "id": model.id,
-        "location_input": model.location_input,
-        "resolved_name": model.resolved_name,
-        "country": model.country,
-        "state": model.state,
-        "lat": model.lat,
-        "lon": model.lon,
-        "start_date": model.start_date,
-        "end_date": model.end_date,
-        "daily_temps": json.loads(model.daily_temps_json or "[]"),
-        "created_at": model.created_at,
-        "updated_at": model.updated_at,
-    }
+
+def record_to_dict_summary(model: models.WeatherQuery) -> dict:
+    """
+    Convert ORM model -> dict WITHOUT daily temps.
+    Used by list/report views that never show the temps, so we skip JSON parsing.
+    """
+    return dict(zip(_SUMMARY_FIELDS, _get_summary(model)))
+
+
+def record_to_dict_full(model: models.WeatherQuery) -> dict:
+    """Convert ORM model -> dict (including parsed daily temps) for JSON/templates/export."""
+    values = list(_get_full(model))
+    values[_TEMPS_IDX] = orjson.loads(values[_TEMPS_IDX] or "[]")
+    return dict(zip(_FULL_KEYS, values))
+
+
+def _etag(*parts) -> str:
+    """Strong ETag from whatever identifies the response content."""
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if the client already has this representation (If-None-Match)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def _cache_headers(etag: str, last_modified: datetime | None) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        # Timestamps are stored as naive UTC.
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
 
 
 # -------------------------
@@ -76,7 +164,11 @@ async def home(request: Request):
 
 
 @app.get("/results", response_class=HTMLResponse)
-async def results_page(request: Request, q: str = Query(..., min_length=2, max_length=255)):
+async def results_page(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=255),
+    owm: OpenWeatherClient = Depends(get_owm),
+):
     """
     Server-rendered weather result page.
     - geocode -> lat/lon
@@ -84,20 +176,24 @@ async def results_page(request: Request, q: str = Query(..., min_length=2, max_l
     - 5-day forecast summarized to daily cards
     - link to YouTube search for location
     """
+    error = None
     try:
-        resolved = await owm.geocode(q)
-        youtube_query = quote_plus(f"{resolved.name} {resolved.state} {resolved.country}".strip())
-        youtube_url = f"https://www.youtube.com/results?search_query={youtube_query}"
-        current = await owm.current_weather(resolved.lat, resolved.lon, units="imperial")
-        forecast_raw = await owm.forecast_5day_3h(resolved.lat, resolved.lon, units="imperial")
-        five_day = owm.summarize_to_5_days(forecast_raw)
+        resolved = await cached_geocode(owm, q)
+        current, forecast_raw = await owm.current_and_forecast(resolved.lat, resolved.lon, units="imperial")
     except WeatherError as e:
+        error = str(e)
+
+    if error is not None:
         return templates.TemplateResponse(
             "results.html",
-            {"request": request, "error": str(e), "q": q, "candidate_name": settings.candidate_name},
+            {"request": request, "error": error, "q": q, "candidate_name": settings.candidate_name},
             status_code=400,
         )
 
+    youtube_query = quote_plus(f"{resolved.name} {resolved.state} {resolved.country}".strip())
+    youtube_url = f"https://www.youtube.com/results?search_query={youtube_query}"
+    five_day = owm.summarize_to_5_days(forecast_raw)
+
     return templates.TemplateResponse(
         "results.html",
         {
@@ -116,7 +212,7 @@ async def results_page(request: Request, q: str = Query(..., min_length=2, max_l
 @app.get("/records", response_class=HTMLResponse)
 async def records_page(request: Request, db: Session = Depends(get_db)):
     """List saved records."""
-    records = [record_to_dict(r) for r in list_records(db)]
+    records = [dict(r) for r in list_records_summary(db)]
     return templates.TemplateResponse("records.html", {"request": request, "records": records})
 
 
@@ -126,7 +222,7 @@ async def record_detail_page(request: Request, record_id: int, db: Session = Dep
     r = get_record(db, record_id)
     if not r:
         raise HTTPException(status_code=404, detail="Record not found")
-    return templates.TemplateResponse("record_detail.html", {"request": request, "record": record_to_dict(r)})
+    return templates.TemplateResponse("record_detail.html", {"request": request, "record": record_to_dict_full(r)})
 
 
 # -------------------------
@@ -134,7 +230,7 @@ async def record_detail_page(request: Request, record_id: int, db: Session = Dep
 # -------------------------
 
 @app.get("/api/weather")
-async def api_weather(q: str = Query(..., min_length=2, max_length=255)):
+async def api_weather(q: str = Query(..., min_length=2, max_length=255), owm: OpenWeatherClient = Depends(get_owm)):
     """
     Location-based weather (Assessment 1):
     - current weather
@@ -142,36 +238,42 @@ async def api_weather(q: str = Query(..., min_length=2, max_length=255)):
     - icon codes returned by OpenWeather
     """
     try:
-        resolved = await owm.geocode(q)
-        current = await owm.current_weather(resolved.lat, resolved.lon, units="imperial")
-        forecast_raw = await owm.forecast_5day_3h(resolved.lat, resolved.lon, units="imperial")
-        five_day = owm.summarize_to_5_days(forecast_raw)
-        return {"resolved": resolved.__dict__, "current": current, "five_day": five_day}
+        resolved = await cached_geocode(owm, q)
+        # Only the day cards are returned, so the forecast is summarized while it streams in.
+        current, five_day = await asyncio.gather(
+            owm.current_weather(resolved.lat, resolved.lon, units="imperial"),
+            owm.forecast_5day_summary(resolved.lat, resolved.lon, units="imperial"),
+        )
     except WeatherError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    return {"resolved": resolved.__dict__, "current": current, "five_day": five_day}
+
 
 @app.get("/api/weather/by-coords")
-async def api_weather_by_coords(lat: float, lon: float):
+async def api_weather_by_coords(lat: float, lon: float, owm: OpenWeatherClient = Depends(get_owm)):
     """
     Current-location weather (Assessment 1 "stand out"):
     - browser provides coords via Geolocation API
     - server returns current + 5-day forecast
     """
     try:
-        current = await owm.current_weather(lat, lon, units="imperial")
-        forecast_raw = await owm.forecast_5day_3h(lat, lon, units="imperial")
-        five_day = owm.summarize_to_5_days(forecast_raw)
-        resolved = await owm.geocode(f"{lat},{lon}")
+        # All lookups only need lat/lon, so run them concurrently.
+        async with asyncio.TaskGroup() as tg:
+            t_weather = tg.create_task(owm.current_and_forecast(lat, lon, units="imperial"))
+            t_geo = tg.create_task(cached_geocode(owm, f"{lat},{lon}"))
+    except* WeatherError as eg:
+        raise HTTPException(status_code=400, detail=str(eg.exceptions[0]))
 
-        return {
-            "resolved": resolved.__dict__,
-            "current": current,
-            "five_day": five_day,
-            "forecast_3h": forecast_raw,
-        }
-    except WeatherError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    (current, forecast_raw), resolved = t_weather.result(), t_geo.result()
+    five_day = owm.summarize_to_5_days(forecast_raw)
+
+    return {
+        "resolved": resolved.__dict__,
+        "current": current,
+        "five_day": five_day,
+        "forecast_3h": forecast_raw,
+    }
 
 
 # -------------------------
@@ -179,57 +281,144 @@ async def api_weather_by_coords(lat: float, lon: float):
 # -------------------------
 
 @app.post("/api/records")
-async def api_create_record(payload: RecordCreate, db: Session = Depends(get_db)):
+async def api_create_record(
+    payload: RecordCreate,
+    db: Session = Depends(get_db),
+    owm: OpenWeatherClient = Depends(get_owm),
+    om: OpenMeteoClient = Depends(get_om),
+):
     """Create a stored date-range query."""
     try:
         rec = await create_record(db, payload, owm, om)
-        return record_to_dict(rec)
+        return record_to_dict_full(rec)
+    except WeatherError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/records/bulk")
+async def api_bulk_create_records(
+    payloads: list[RecordCreate],
+    db: Session = Depends(get_db),
+    owm: OpenWeatherClient = Depends(get_owm),
+    om: OpenMeteoClient = Depends(get_om),
+):
+    """Create many stored date-range queries in one request (single transaction)."""
+    try:
+        recs = await bulk_create(db, payloads, owm, om)
+        return [record_to_dict_full(r) for r in recs]
     except WeatherError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/api/records")
-def api_list_records(limit: int = 100, offset: int = 0, db: Session = Depends(get_db)):
-    """List records with pagination."""
-    recs = list_records(db, limit=limit, offset=offset)
-    return [record_to_dict(r) for r in recs]
+def api_list_records(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    List records (newest first) with cursor pagination.
+    Pass the returned `next_cursor` back as `cursor` to get the next page.
+    Supports If-None-Match: unchanged data returns 304 without a body.
+    """
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except WeatherError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    latest, count = records_version(db)
+    etag = _etag("list", latest, count, limit, cursor)
+    headers = _cache_headers(etag, latest)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    recs = list_records_summary(db, limit=limit, before=before)
+    next_cursor = encode_cursor(recs[-1]["created_at"], recs[-1]["id"]) if len(recs) == limit else None
+    # Summary rows only; daily temps are available per record at /api/records/{id}.
+    return {"records": [dict(r) for r in recs], "next_cursor": next_cursor}
 
 
 # -------------------------
 # Export endpoint
 # -------------------------
 
+def _iter_export_dicts(with_temps: bool, max_rows: int):
+    """
+    Yield export rows from a session owned by the generator itself.
+
+    A request-scoped `Depends(get_db)` session may be closed before a
+    StreamingResponse body is consumed, so the export manages its own.
+    """
+    to_dict = record_to_dict_full if with_temps else record_to_dict_summary
+    with SessionLocal() as db:
+        for r in iter_all_records(db, max_rows=max_rows, with_temps=with_temps):
+            yield to_dict(r)
+
+
 @app.get("/api/records/export")
-def api_export_records(fmt: str = Query("json", pattern="^(json|csv|md)$"), db: Session = Depends(get_db)):
-    """Export records to JSON/CSV/Markdown."""
-    recs = [record_to_dict(r) for r in list_records(db, limit=1000, offset=0)]
+def api_export_records(
+    request: Request,
+    fmt: str = Query("json", pattern="^(json|csv|md)$"),
+    pretty: bool = False,
+    max_rows: int = Query(10000, ge=1, le=100000),
+    db: Session = Depends(get_db),
+):
+    """
+    Export the newest `max_rows` records to JSON/CSV/Markdown (`pretty=1` indents the JSON).
+
+    The response is streamed: rows are read from SQLite in batches and
+    formatted one at a time, so memory stays flat regardless of export size.
+    Supports If-None-Match: unchanged data returns 304 without a body.
+    """
+    latest, count = records_version(db)
+    etag = _etag("export", latest, count, fmt, pretty, max_rows)
+    headers = _cache_headers(etag, latest)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
     if fmt == "json":
-        return PlainTextResponse(export_json(recs), media_type="application/json")
+        return StreamingResponse(iter_export_json(_iter_export_dicts(with_temps=True, max_rows=max_rows), pretty=pretty), media_type="application/json", headers=headers)
     if fmt == "csv":
-        return PlainTextResponse(export_csv(recs), media_type="text/csv")
+        return StreamingResponse(iter_export_csv(_iter_export_dicts(with_temps=True, max_rows=max_rows)), media_type="text/csv", headers=headers)
     if fmt == "md":
-        return PlainTextResponse(export_markdown(recs), media_type="text/markdown")
+        # The Markdown report omits daily temps, so don't parse them at all.
+        return StreamingResponse(iter_export_markdown(_iter_export_dicts(with_temps=False, max_rows=max_rows)), media_type="text/markdown", headers=headers)
     raise HTTPException(status_code=400, detail="Unsupported format")
 
 
 @app.get("/api/records/{record_id}")
-def api_get_record(record_id: int, db: Session = Depends(get_db)):
-    """Fetch a single record."""
+def api_get_record(record_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    """Fetch a single record (304 via If-None-Match if unchanged)."""
     r = get_record(db, record_id)
     if not r:
         raise HTTPException(status_code=404, detail="Record not found")
-    return record_to_dict(r)
+
+    etag = _etag("record", r.id, r.updated_at)
+    headers = _cache_headers(etag, r.updated_at)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return record_to_dict_full(r)
 
 
 @app.put("/api/records/{record_id}")
-async def api_update_record(record_id: int, payload: RecordUpdate, db: Session = Depends(get_db)):
+async def api_update_record(
+    record_id: int,
+    payload: RecordUpdate,
+    db: Session = Depends(get_db),
+    owm: OpenWeatherClient = Depends(get_owm),
+    om: OpenMeteoClient = Depends(get_om),
+):
     """Update location/date range, re-fetch temps, and persist."""
     r = get_record(db, record_id)
     if not r:
         raise HTTPException(status_code=404, detail="Record not found")
     try:
         updated = await update_record(db, r, payload, owm, om)
-        return record_to_dict(updated)
+        return record_to_dict_full(updated)
     except WeatherError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -8,12 +8,32 @@ We store:
 - returned daily temperatures (JSON serialized)
 """
 
-from sqlalchemy import String, Integer, Float, Date, DateTime, Text
+from sqlalchemy import String, Integer, Float, Date, DateTime, Text, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
-from datetime import datetime
+from datetime import datetime, timezone
 from .db import Base
 
 
+def utcnow() -> datetime:
+    """Naive UTC "now" (the convention all stored timestamps use)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def db_now():
+    """
+    "Now" evaluated by SQLite itself, as a SQL expression.
+
+    Formatted exactly like SQLAlchemy stores DateTime values
+    ("YYYY-MM-DD HH:MM:SS.ffffff"; SQLite's %f is "SS.SSS"), so DB-generated
+    and Python-bound timestamps still compare correctly as text.
+    """
+    return func.strftime("%Y-%m-%d %H:%M:%f000", "now")
+
+
+# Same expression as DDL, so rows inserted outside the ORM get timestamps too.
+_DB_NOW_DEFAULT = text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))")
+
+
 class WeatherQuery(Base):
     __tablename__ = "weather_queries"
 
@@ -36,8 +56,54 @@ class WeatherQuery(Base):
     # Stored daily temperature results as a JSON string.
     # Example:
     #   [{"date":"2025-12-10","tmin":2.1,"tmax":6.2}, ...]
-    daily_temps_json: Mapped[str] = mapped_column(Text)
+    # Deferred: only loaded when accessed or undefer()'d (detail/export paths),
+    # so plain record queries don't move this multi-KB blob out of SQLite.
+    daily_temps_json: Mapped[str] = mapped_column(Text, deferred=True)
 
     # Timestamps (nice for CRUD audit and sorting)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Generated by the DB clock (rendered inline into INSERT/UPDATE, no Python value).
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=db_now(), server_default=_DB_NOW_DEFAULT)
+    # Indexed so MAX(updated_at) (ETag/version checks) is an index lookup
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=db_now(), server_default=_DB_NOW_DEFAULT, onupdate=db_now(), index=True
+    )
+
+
+# Backs newest-first listing (ORDER BY created_at DESC[, id DESC]) and the
+# keyset pagination in crud.list_records; created_at is its leading column.
+Index("ix_wq_created_id", WeatherQuery.created_at.desc(), WeatherQuery.id.desc())
+
+
+class GeocodeCache(Base):
+    """
+    Persistent geocoding cache (see app/geocache.py).
+
+    Keyed by the normalized location string the user typed.
+    """
+    __tablename__ = "geocode_cache"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    name: Mapped[str] = mapped_column(String(255))
+    country: Mapped[str] = mapped_column(String(32), default="")
+    state: Mapped[str] = mapped_column(String(64), default="")
+    lat: Mapped[float] = mapped_column(Float)
+    lon: Mapped[float] = mapped_column(Float)
+
+    # Used for TTL expiry
+    cached_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+
+
+class DailyTempsCache(Base):
+    """
+    Persistent Open-Meteo daily temps cache (see app/tempscache.py).
+
+    Keyed by rounded lat/lon + date range.
+    """
+    __tablename__ = "daily_temps_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    temps_json: Mapped[str] = mapped_column(Text)
+
+    # Used for TTL expiry of ranges that were not fully in the past
+    cached_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
@@ -26,5 +26,12 @@ class Settings(BaseSettings):
     # SQLite file path (simple local persistence)
     sqlite_path: str = "weather_app.sqlite3"
 
+    # Create missing tables/indexes at startup (disable on extra workers)
+    init_schema: bool = True
+
+    # Jinja2 compiled-template cache; turn auto-reload on while editing templates
+    jinja_cache_dir: str = ".jinja_cache"
+    templates_auto_reload: bool = False
+
 
 settings = Settings()
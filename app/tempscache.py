@@ -0,0 +1,140 @@
+"""
+Daily temperatures cache.
+
+Why cache Open-Meteo daily temps?
+- The same place + date range always yields the same temps once the range
+  is in the past, so repeat create/update requests never need the network
+- Ranges that reach today/the future are forecasts and still change, so
+  those are only reused for a short while
+
+Same layout as app/geocache.py:
+- in-process LRU (fast path)
+- SQLite table (survives restarts), for final (past) ranges only
+- concurrent misses for the same key share one upstream call
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+import asyncio
+import time
+
+import orjson
+
+from . import models
+from .db import SessionLocal
+from .weather_clients import OpenMeteoClient
+
+
+MAX_SIZE = 4096
+
+# TTL for ranges that include recent/future dates (forecast data).
+FORECAST_TTL_S = 60 * 60
+
+# key -> (expires_at (monotonic seconds) or None for "never", temps)
+_cache: "OrderedDict[str, tuple[float | None, List[Dict[str, Any]]]]" = OrderedDict()
+
+_locks: dict[str, asyncio.Lock] = {}
+
+
+def make_key(lat: float, lon: float, start: date, end: date) -> str:
+    """~100 m coordinate precision is plenty for daily temperatures."""
+    return f"{round(lat, 3)}:{round(lon, 3)}:{start.isoformat()}:{end.isoformat()}"
+
+
+def _is_final(end: date, as_of: datetime) -> bool:
+    """
+    True if the range was fully in the past at `as_of` (UTC).
+
+    We keep a day of slack: "yesterday" in UTC can still be "today"
+    for the location, and its values may still be filled in.
+    """
+    return end < as_of.date() - timedelta(days=1)
+
+
+def _get_fresh(key: str) -> List[Dict[str, Any]] | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, temps = entry
+    if expires_at is not None and expires_at <= time.monotonic():
+        del _cache[key]
+        return None
+
+    _cache.move_to_end(key)
+    return temps
+
+
+def _remember(key: str, temps: List[Dict[str, Any]], ttl_s: float | None) -> None:
+    expires_at = None if ttl_s is None else time.monotonic() + ttl_s
+    _cache[key] = (expires_at, temps)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_SIZE:
+        _cache.popitem(last=False)
+
+
+def _load_persisted(key: str, end: date) -> List[Dict[str, Any]] | None:
+    """Return final temps from SQLite, if we have them."""
+    with SessionLocal() as db:
+        row = db.get(models.DailyTempsCache, key)
+        if row is None:
+            return None
+
+        if not _is_final(end, row.cached_at):
+            # Forecast rows aren't written anymore; drop any left from older versions.
+            db.delete(row)
+            db.commit()
+            return None
+
+        return orjson.loads(row.temps_json)
+
+
+def _persist(key: str, temps: List[Dict[str, Any]]) -> None:
+    with SessionLocal() as db:
+        db.merge(models.DailyTempsCache(
+            key=key,
+            temps_json=orjson.dumps(temps).decode(),
+            cached_at=models.utcnow(),
+        ))
+        db.commit()
+
+
+async def cached_daily_temps(om: OpenMeteoClient, lat: float, lon: float, start: date, end: date) -> List[Dict[str, Any]]:
+    """
+    Drop-in replacement for `om.daily_temps(...)` backed by the cache.
+
+    Errors are not cached.
+    """
+    key = make_key(lat, lon, start, end)
+
+    hit = _get_fresh(key)
+    if hit is not None:
+        return hit
+
+    lock = _locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            hit = _get_fresh(key)
+            if hit is not None:
+                return hit
+
+            persisted = _load_persisted(key, end)
+            if persisted is not None:
+                _remember(key, persisted, None)
+                return persisted
+
+            temps = await om.daily_temps(lat, lon, start, end)
+            if _is_final(end, models.utcnow()):
+                _persist(key, temps)
+                _remember(key, temps, None)
+            else:
+                # Forecast values still change: keep them in memory briefly,
+                # not on disk where they'd only be rewritten or deleted later.
+                _remember(key, temps, FORECAST_TTL_S)
+            return temps
+    finally:
+        if not lock.locked() and _locks.get(key) is lock:
+            del _locks[key]
@@ -9,12 +9,110 @@ We intentionally separate API logic from FastAPI endpoints:
 
 from __future__ import annotations
 
+from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass
-from datetime import datetime, date, timezone, timedelta
-from typing import Any, Dict, List, Tuple
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NoReturn, Tuple
 import asyncio
 import httpx
+import importlib.util
+import math
+import orjson
 import re
+import time
+
+try:  # optional: incremental JSON parsing for forecast_5day_summary()
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+# geocode() input formats as one pattern, so an input is scanned once and
+# dispatched on m.lastgroup (the outer named group closes last). Alternatives
+# are tried in the same order geocode() checks them; see there for examples.
+_GEOCODE_RE = re.compile(
+    r"""
+    \s*
+    (?:
+        (?P<coord> (?P<lat>-?\d+(?:\.\d+)?) \s*,\s* (?P<lon>-?\d+(?:\.\d+)?) )
+      | (?P<zip> (?P<zip5>\d{5})(?:-\d{4})? \s* (?:,\s*(?P<zip_cc>[a-z]{2}))? )
+      | (?P<postal_city_cc> (?P<pcc_postal>[A-Z0-9][A-Z0-9 \-]{2,12}) \s*,\s*
+                            (?P<pcc_city>[^,]{2,64}) \s*,\s* (?P<pcc_cc>[A-Z]{2}) )
+      | (?P<postal_cc> (?P<pc_postal>[A-Z0-9][A-Z0-9 \-]{2,12}) \s*,\s* (?P<pc_cc>[A-Z]{2}) )
+    )
+    \s*
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# HTTP/2 needs the "h2" package (installed via httpx[http2]). Without it httpx
+# raises on http2=True, so fall back to HTTP/1.1 keep-alive instead.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# date.fromordinal() of day 0 in Unix time (1970-01-01).
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# English day/month abbreviations for forecast cards ("%a" / "%b" without
+# going through strftime or depending on the process locale).
+_DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Stand-in for steps without a "weather" entry (shared, never mutated).
+_EMPTY_WEATHER: Dict[str, str] = {}
+
+
+def _summarize_steps(steps: Iterable[Tuple[int, float | None, Any, str, str]], tz_offset: int) -> List[Dict[str, Any]]:
+    """
+    Reduce forecast steps to (up to) 5 daily cards.
+
+    Each step is (dt_utc, temp or None, pop or None, icon, description);
+    tz_offset is the city's offset from UTC in seconds.
+    """
+    # One pass over the steps, accumulating everything a day card needs.
+    # Days are keyed by local day number since the epoch (plain int
+    # math); real date objects are only built for the days we emit.
+    agg: Dict[int, Dict[str, Any]] = defaultdict(
+        lambda: {"tmin": math.inf, "tmax": -math.inf, "pop_sum": 0.0, "pop_n": 0, "wx": Counter()}
+    )
+    for dt, t, pop, icon, desc in steps:
+        a = agg[(dt + tz_offset) // 86400]
+
+        if t is not None:
+            a["tmin"] = min(a["tmin"], t)
+            a["tmax"] = max(a["tmax"], t)
+
+        # percent chance of precipitation for the step
+        if pop is not None:
+            a["pop_sum"] += float(pop)
+            a["pop_n"] += 1
+
+        # Tally icon/description so we can pick the most frequent one
+        a["wx"][(icon, desc)] += 1
+
+    days: List[Dict[str, Any]] = []
+    for day_num in sorted(agg)[:5]:
+        a = agg[day_num]
+        d = date.fromordinal(_EPOCH_ORDINAL + day_num)
+
+        # Use average probability instead of max
+        pop_pct = round(a["pop_sum"] / a["pop_n"] * 100) if a["pop_n"] else None
+
+        # most_common keeps first-seen order on ties, like the old max() scan
+        (icon, desc) = a["wx"].most_common(1)[0][0]
+
+        days.append({
+            "date": d.isoformat(),  # keep existing ISO date
+            "dow": _DOW[d.weekday()],  # e.g., "Fri"
+            "date_display": f"{_MONTH[d.month - 1]} {d.day:02d}, {d.year}",  # e.g., "Dec 14, 2025"
+            "tmin": a["tmin"] if a["tmin"] != math.inf else None,
+            "tmax": a["tmax"] if a["tmax"] != -math.inf else None,
+            "icon": icon,
+            "description": desc,
+            "pop_pct": pop_pct,
+        })
+
+    return days
 
 
 @dataclass(frozen=True)
@@ -34,7 +132,101 @@ class WeatherError(RuntimeError):
     pass
 
 
-class OpenWeatherClient:
+# Upstream error bodies are only shown as a hint, so keep exceptions small.
+_ERROR_BODY_MAX = 256
+
+
+def _raise_http(what: str, r: httpx.Response) -> NoReturn:
+    """Raise WeatherError for a non-200 response, with a truncated body."""
+    body = r.content[:_ERROR_BODY_MAX].decode("utf-8", "replace")
+    raise WeatherError(f"{what} failed ({r.status_code}): {body}")
+
+
+# TTLs for cached OpenWeather responses, and the per-cache entry cap.
+CURRENT_TTL_S = 5 * 60
+FORECAST_TTL_S = 30 * 60
+WEATHER_CACHE_MAX = 1024
+
+
+def _point_key(lat: float, lon: float, units: str) -> Tuple[float, float, str]:
+    """~100 m coordinate precision: nearby lookups share a cached response."""
+    return (round(lat, 3), round(lon, 3), units)
+
+
+class _TTLCache:
+    """
+    Small in-process LRU with a fixed TTL (same approach as app/geocache.py,
+    minus persistence: these responses are only worth keeping for minutes).
+    """
+
+    def __init__(self, ttl_s: float, max_size: int = WEATHER_CACHE_MAX):
+        self.ttl_s = ttl_s
+        self.max_size = max_size
+        # key -> (expires_at (monotonic seconds), value)
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl_s, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class _PooledHTTPClient:
+    """
+    Owns one long-lived httpx.AsyncClient for all calls made by a client.
+
+    Reusing the connection pool means repeat requests skip the TCP + TLS
+    handshake (often 100-300 ms), and HTTP/2 lets concurrent calls to the
+    same host (e.g. current + forecast) share one connection.
+
+    Use as `async with Client(...) as c:` (the app does this in its
+    lifespan) or call aopen()/aclose() directly; if a method is used
+    before aopen(), the pool is created lazily.
+    """
+
+    timeout_s: float
+    _client: httpx.AsyncClient | None = None
+
+    async def aopen(self) -> None:
+        self._http()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        await self.aopen()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+                timeout=self.timeout_s,
+            )
+        return self._client
+
+
+class OpenWeatherClient(_PooledHTTPClient):
     """
     OpenWeatherMap wrapper.
 
@@ -54,7 +246,43 @@ class OpenWeatherClient:
         self.timeout_s = timeout_s
         self.base = "https://api.openweathermap.org"
 
-    async def geocode(self, query: str) -> ResolvedLocation:
+        # Short-lived response caches (OpenWeather updates roughly every 10 min).
+        # Cached payloads are shared between callers, so treat them as read-only.
+        self._current_cache = _TTLCache(CURRENT_TTL_S)
+        self._forecast_cache = _TTLCache(FORECAST_TTL_S)
+        self._summary_cache = _TTLCache(FORECAST_TTL_S)
+
+        # (kind, *args) -> future of the upstream call currently in flight
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+    async def _coalesced(self, key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fetch()` once for concurrent identical calls; the others await
+        its outcome (result or exception) instead of issuing the same request.
+        """
+        fut = self._inflight.get(key)
+        if fut is not None:
+            # shield: a waiter being cancelled must not cancel the shared call
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; waiters (if any) re-raise it
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def geocode(self, query: str, *, reverse: bool = True) -> ResolvedLocation:
         """
         Resolve a user-provided location string into a (name/state/country/lat/lon).
 
@@ -62,6 +290,13 @@ class OpenWeatherClient:
 
         1) Coordinates: "40.7128,-74.0060"
            - We validate bounds and then reverse-geocode to get a human-friendly label.
+           - reverse=False skips that lookup (no HTTP at all) for callers that only
+             need the coordinates; the label is then "Current Location".
+             Only coordinate input is affected. Anything that stores or shows the
+             label (saved records, result pages) should keep the default; pass
+             reverse=False where just lat/lon feed e.g. OpenMeteoClient.daily_temps.
+
+        Concurrent calls for the same input share one lookup.
 
         2) ZIP code: "10001" or "10001-1234" or "10001,US"
            - Uses OpenWeather's ZIP geocoding endpoint, which is more reliable than "direct"
@@ -70,35 +305,54 @@ class OpenWeatherClient:
         3) Place name: "Austin, TX" or "Paris, FR"
            - Uses OpenWeather direct geocoding; we select the top match.
         """
+        return await self._coalesced(("geocode", query, reverse), lambda: self._geocode(query, reverse))
+
+    async def _geocode(self, query: str, reverse: bool) -> ResolvedLocation:
+        """geocode() without in-flight coalescing."""
         # raw = query.strip()
         raw = query.strip().strip("'\"")
 
+        if len(raw) == 5 and raw.isdecimal():
+            # Bare 5-digit ZIP (the most common input): no regex needed.
+            m, kind = None, "zip"
+        elif "," in raw or raw.lstrip()[:5].isdecimal():
+            # Every other structured format has a comma or starts with a ZIP,
+            # so plain place names ("Austin") skip the regex entirely.
+            m = _GEOCODE_RE.fullmatch(raw)
+            kind = m.lastgroup if m else None
+        else:
+            m, kind = None, None
+
         # ---------------------------------------------------------------------
         # 1) Coordinate detection: "lat,lon" (optional whitespace)
         # ---------------------------------------------------------------------
-        coord_match = re.fullmatch(
-            r"\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*",
-            raw,
-        )
-        if coord_match:
-            lat = float(coord_match.group(1))
-            lon = float(coord_match.group(2))
-
-            # Validate coordinate ranges
-            if not (-90.0 <= lat <= 90.0):
-                raise WeatherError("Invalid latitude. Must be between -90 and 90.")
-            if not (-180.0 <= lon <= 180.0):
+        if kind == "coord":
+            lat = float(m["lat"])
+            lon = float(m["lon"])
+
+            # Validate coordinate ranges (valid input, the common case, is one check)
+            if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+                if not -90.0 <= lat <= 90.0:
+                    raise WeatherError("Invalid latitude. Must be between -90 and 90.")
                 raise WeatherError("Invalid longitude. Must be between -180 and 180.")
 
+            if not reverse:
+                return ResolvedLocation(
+                    name="Current Location",
+                    state="",
+                    country="",
+                    lat=lat,
+                    lon=lon,
+                )
+
             # Reverse geocode: lat/lon -> best human-friendly place name/state/country
             params = {"lat": lat, "lon": lon, "limit": 1, "appid": self.api_key}
-            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-                r = await client.get(f"{self.base}/geo/1.0/reverse", params=params)
+            r = await self._http().get(f"{self.base}/geo/1.0/reverse", params=params)
 
             if r.status_code != 200:
-                raise WeatherError(f"Reverse geocoding failed ({r.status_code}): {r.text}")
+                _raise_http("Reverse geocoding", r)
 
-            results = r.json() or []
+            results = orjson.loads(r.content) or []
             if results:
                 best = results[0]
                 return ResolvedLocation(
@@ -122,22 +376,16 @@ class OpenWeatherClient:
         # 2) ZIP detection: "12345" or "12345-6789" optionally ",CC" (country code)
         #    Examples: "10001", "10001-1234", "10001,US", "10001-1234,US"
         # ---------------------------------------------------------------------
-        zip_match = re.fullmatch(
-            r"(?i)\s*(\d{5})(?:-\d{4})?\s*(?:,\s*([a-z]{2}))?\s*",
-            raw,
-        )
-        if zip_match:
-            zip5 = zip_match.group(1)
-            country = (zip_match.group(2) or "US").upper()
+        if kind == "zip":
+            zip5, country = (m["zip5"], (m["zip_cc"] or "US").upper()) if m else (raw, "US")
 
             params = {"zip": f"{zip5},{country}", "appid": self.api_key}
-            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-                r = await client.get(f"{self.base}/geo/1.0/zip", params=params)
+            r = await self._http().get(f"{self.base}/geo/1.0/zip", params=params)
 
             if r.status_code != 200:
-                raise WeatherError(f"ZIP geocoding failed ({r.status_code}): {r.text}")
+                _raise_http("ZIP geocoding", r)
 
-            data = r.json()
+            data = orjson.loads(r.content)
             return ResolvedLocation(
                 name=data.get("name", raw),
                 # ZIP endpoint returns country, but typically does NOT include state reliably
@@ -156,14 +404,10 @@ class OpenWeatherClient:
         # ---------------------------------------------------------------------
 
         # B) "POSTAL, CITY, CC"
-        postal_city_cc = re.fullmatch(
-            r"(?i)\s*([A-Z0-9][A-Z0-9 \-]{2,12})\s*,\s*([^,]{2,64})\s*,\s*([A-Z]{2})\s*",
-            raw,
-        )
-        if postal_city_cc:
-            postal = postal_city_cc.group(1).strip()
-            city = postal_city_cc.group(2).strip()
-            country = postal_city_cc.group(3).upper()
+        if kind == "postal_city_cc":
+            postal = m["pcc_postal"].strip()
+            city = m["pcc_city"].strip()
+            country = m["pcc_cc"].upper()
 
             # Try a few query variants (OpenWeather is picky)
             candidates = [
@@ -172,22 +416,15 @@ class OpenWeatherClient:
                 f"{postal}, {country}",
             ]
 
-            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-                for q in candidates:
-                    r = await client.get(f"{self.base}/geo/1.0/direct",
-                                         params={"q": q, "limit": 5, "appid": self.api_key})
-                    if r.status_code != 200:
-                        continue
-                    results = r.json() or []
-                    if results:
-                        best = results[0]
-                        return ResolvedLocation(
-                            name=best.get("name", raw),
-                            state=best.get("state", ""),
-                            country=best.get("country", country),
-                            lat=float(best["lat"]),
-                            lon=float(best["lon"]),
-                        )
+            best = await self._first_direct_match(candidates)
+            if best:
+                return ResolvedLocation(
+                    name=best.get("name", raw),
+                    state=best.get("state", ""),
+                    country=best.get("country", country),
+                    lat=float(best["lat"]),
+                    lon=float(best["lon"]),
+                )
 
             raise WeatherError(
                 "Postal code not found for that city/country. Try 'SW1A 1AA, GB' "
@@ -195,31 +432,20 @@ class OpenWeatherClient:
             )
 
         # A) "POSTAL, CC"
-        postal_cc = re.fullmatch(
-            r"(?i)\s*([A-Z0-9][A-Z0-9 \-]{2,12})\s*,\s*([A-Z]{2})\s*",
-            raw,
-        )
-        if postal_cc:
-            postal = postal_cc.group(1).strip()
-            country = postal_cc.group(2).upper()
-
-            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-                # try a couple variants
-                for q in (f"{postal}, {country}", f"{postal} {country}"):
-                    r = await client.get(f"{self.base}/geo/1.0/direct",
-                                         params={"q": q, "limit": 5, "appid": self.api_key})
-                    if r.status_code != 200:
-                        continue
-                    results = r.json() or []
-                    if results:
-                        best = results[0]
-                        return ResolvedLocation(
-                            name=best.get("name", raw),
-                            state=best.get("state", ""),
-                            country=best.get("country", country),
-                            lat=float(best["lat"]),
-                            lon=float(best["lon"]),
-                        )
+        if kind == "postal_cc":
+            postal = m["pc_postal"].strip()
+            country = m["pc_cc"].upper()
+
+            # try a couple variants
+            best = await self._first_direct_match([f"{postal}, {country}", f"{postal} {country}"])
+            if best:
+                return ResolvedLocation(
+                    name=best.get("name", raw),
+                    state=best.get("state", ""),
+                    country=best.get("country", country),
+                    lat=float(best["lat"]),
+                    lon=float(best["lon"]),
+                )
 
             raise WeatherError(
                 "Postal code not found. Try adding the city too (e.g., 'SW1A 1AA, London, GB') "
@@ -230,13 +456,12 @@ class OpenWeatherClient:
         # 3) Default: place / city direct geocoding ("Austin, TX", "Paris, FR")
         # ---------------------------------------------------------------------
         params = {"q": raw, "limit": 5, "appid": self.api_key}
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.get(f"{self.base}/geo/1.0/direct", params=params)
+        r = await self._http().get(f"{self.base}/geo/1.0/direct", params=params)
 
         if r.status_code != 200:
-            raise WeatherError(f"Geocoding failed ({r.status_code}): {r.text}")
+            _raise_http("Geocoding", r)
 
-        results = r.json() or []
+        results = orjson.loads(r.content) or []
         if not results:
             # Landmark/POI fallback via Nominatim
             nom = await self.nominatim_geocode(raw)
@@ -257,12 +482,44 @@ class OpenWeatherClient:
             lon=float(best["lon"]),
         )
 
+    async def _first_direct_match(self, queries: List[str]) -> Dict[str, Any] | None:
+        """
+        Run direct geocoding for several query variants concurrently.
+
+        Returns the top result of the earliest variant (in the given order)
+        that matched anything, or None. Variants are listed most specific
+        first, so we keep that preference; once it is decided, requests
+        still in flight are cancelled. Wall time is ~1 round trip instead
+        of up to one per variant.
+        """
+        url = f"{self.base}/geo/1.0/direct"
+        tasks = [
+            asyncio.create_task(self._http().get(url, params={"q": q, "limit": 5, "appid": self.api_key}))
+            for q in queries
+        ]
+        try:
+            for task in tasks:
+                r = await task
+                if r.status_code != 200:
+                    continue
+                results = orjson.loads(r.content) or []
+                if results:
+                    return results[0]
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark as retrieved; the first error already propagated
+
     async def _get_json_with_retry_on_timeout(
             self,
             client: httpx.AsyncClient,
             url: str,
             *,
             params: dict,
+            headers: dict | None = None,
             retries: int = 2,  # total tries = retries + 1
             backoff_s: float = 0.5,  # 0.5s, 1.0s, 2.0s ...
     ) -> list[dict]:
@@ -275,13 +532,13 @@ class OpenWeatherClient:
 
         for attempt in range(retries + 1):
             try:
-                r = await client.get(url, params=params)
+                r = await client.get(url, params=params, headers=headers)
 
                 # If we get a non-200, don't loop forever; return empty -> caller treats as "no result"
                 if r.status_code != 200:
                     return []
 
-                data = r.json()
+                data = orjson.loads(r.content)
                 return data if isinstance(data, list) else []
 
             except (httpx.ReadTimeout, httpx.ConnectTimeout) as e:
@@ -299,18 +556,18 @@ class OpenWeatherClient:
         headers = {"User-Agent": "weather-app-v1 (local dev)"}
         params = {"q": q, "format": "json", "limit": 1, "addressdetails": 1}
 
-        async with httpx.AsyncClient(timeout=self.timeout_s, headers=headers) as client:
-            try:
-                results = await self._get_json_with_retry_on_timeout(
-                    client,
-                    "https://nominatim.openstreetmap.org/search",
-                    params=params,
-                    retries=2,  # 3 total tries
-                    backoff_s=0.6,
-                )
-            except (httpx.ReadTimeout, httpx.ConnectTimeout):
-                # If Nominatim is flaky, just treat it as no result and let caller show normal error
-                return None
+        try:
+            results = await self._get_json_with_retry_on_timeout(
+                self._http(),
+                "https://nominatim.openstreetmap.org/search",
+                params=params,
+                headers=headers,
+                retries=2,  # 3 total tries
+                backoff_s=0.6,
+            )
+        except (httpx.ReadTimeout, httpx.ConnectTimeout):
+            # If Nominatim is flaky, just treat it as no result and let caller show normal error
+            return None
 
         if not results:
             return None
@@ -328,27 +585,134 @@ class OpenWeatherClient:
     async def current_weather(self, lat: float, lon: float, units: str = "imperial") -> Dict[str, Any]:
         """
         Retrieves current weather conditions for a lat/lon.
+        Responses are reused for CURRENT_TTL_S per ~100 m point.
         """
+        key = _point_key(lat, lon, units)
+        hit = self._current_cache.get(key)
+        if hit is not None:
+            return hit
+        return await self._coalesced(("current", *key), lambda: self._fetch_current(lat, lon, units))
+
+    async def _fetch_current(self, lat: float, lon: float, units: str) -> Dict[str, Any]:
+        key = _point_key(lat, lon, units)
         params = {"lat": lat, "lon": lon, "units": units, "appid": self.api_key}
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.get(f"{self.base}/data/2.5/weather", params=params)
+        r = await self._http().get(f"{self.base}/data/2.5/weather", params=params)
 
         if r.status_code != 200:
-            raise WeatherError(f"Current weather failed ({r.status_code}): {r.text}")
-        return r.json()
+            _raise_http("Current weather", r)
+        data = orjson.loads(r.content)
+        self._current_cache.put(key, data)
+        return data
 
     async def forecast_5day_3h(self, lat: float, lon: float, units: str = "imperial") -> Dict[str, Any]:
         """
         Retrieves the 5-day forecast in 3-hour increments.
         We later summarize this into one card per day (min/max + icon).
+        Responses are reused for FORECAST_TTL_S per ~100 m point.
         """
+        key = _point_key(lat, lon, units)
+        hit = self._forecast_cache.get(key)
+        if hit is not None:
+            return hit
+        return await self._coalesced(("forecast", *key), lambda: self._fetch_forecast(lat, lon, units))
+
+    async def _fetch_forecast(self, lat: float, lon: float, units: str) -> Dict[str, Any]:
+        key = _point_key(lat, lon, units)
         params = {"lat": lat, "lon": lon, "units": units, "appid": self.api_key}
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.get(f"{self.base}/data/2.5/forecast", params=params)
+        r = await self._http().get(f"{self.base}/data/2.5/forecast", params=params)
 
         if r.status_code != 200:
-            raise WeatherError(f"Forecast failed ({r.status_code}): {r.text}")
-        return r.json()
+            _raise_http("Forecast", r)
+        data = orjson.loads(r.content)
+        self._forecast_cache.put(key, data)
+        return data
+
+    async def current_and_forecast(
+            self, lat: float, lon: float, units: str = "imperial"
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Current weather + 5-day forecast for the same point, fetched concurrently
+        (one round trip of wall time; both share the pooled HTTP/2 connection).
+        """
+        current, forecast = await asyncio.gather(
+            self.current_weather(lat, lon, units=units),
+            self.forecast_5day_3h(lat, lon, units=units),
+        )
+        return current, forecast
+
+    async def forecast_5day_summary(self, lat: float, lon: float, units: str = "imperial") -> List[Dict[str, Any]]:
+        """
+        Same result as summarize_to_5_days(await forecast_5day_3h(...)), but
+        the response is parsed incrementally as it arrives (ijson) and each
+        3-hour step is reduced to a small tuple on the fly, so the full nested
+        payload is never materialized. For callers that only need the day cards.
+
+        Falls back to the non-streaming path if ijson isn't installed.
+        Cached like forecast_5day_3h(); a cached full forecast is reused too.
+        """
+        key = _point_key(lat, lon, units)
+        hit = self._summary_cache.get(key)
+        if hit is not None:
+            return hit
+
+        forecast = self._forecast_cache.get(key)
+        if forecast is None and ijson is None:
+            forecast = await self.forecast_5day_3h(lat, lon, units=units)
+        if forecast is not None:
+            days = self.summarize_to_5_days(forecast)
+            self._summary_cache.put(key, days)
+            return days
+
+        params = {"lat": lat, "lon": lon, "units": units, "appid": self.api_key}
+        async with self._http().stream("GET", f"{self.base}/data/2.5/forecast", params=params) as r:
+            if r.status_code != 200:
+                await r.aread()
+                _raise_http("Forecast", r)
+
+            # city.timezone usually comes after "list", so steps are buffered
+            # (as tuples) and bucketed into days once the offset is known.
+            steps: List[Tuple[int, float | None, Any, str, str]] = []
+            tz_offset = 0
+            step: Dict[str, Any] = {}
+            weather_idx = 0
+
+            events = ijson.sendable_list()
+            parser = ijson.parse_coro(events, use_float=True)
+
+            def consume() -> None:
+                nonlocal step, weather_idx, tz_offset
+                for prefix, event, value in events:
+                    if prefix == "list.item":
+                        if event == "start_map":
+                            step, weather_idx = {}, 0
+                        elif event == "end_map":
+                            temp = step.get("temp")
+                            steps.append((
+                                int(step["dt"]),
+                                float(temp) if temp is not None else None,
+                                step.get("pop"),
+                                step.get("icon", ""),
+                                step.get("description", ""),
+                            ))
+                    elif prefix == "list.item.weather.item" and event == "start_map":
+                        weather_idx += 1
+                    elif weather_idx == 1 and prefix in ("list.item.weather.item.icon", "list.item.weather.item.description"):
+                        step[prefix.rpartition(".")[2]] = value
+                    elif prefix in ("list.item.dt", "list.item.main.temp", "list.item.pop"):
+                        step[prefix.rpartition(".")[2]] = value
+                    elif prefix == "city.timezone":
+                        tz_offset = int(value)
+                del events[:]
+
+            async for chunk in r.aiter_bytes():
+                parser.send(chunk)
+                consume()
+            parser.close()
+            consume()
+
+        days = _summarize_steps(steps, tz_offset)
+        self._summary_cache.put(key, days)
+        return days
 
     @staticmethod
     def summarize_to_5_days(forecast_3h: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -365,65 +729,24 @@ class OpenWeatherClient:
         """
         city = forecast_3h.get("city", {})
         tz_offset = int(city.get("timezone", 0))  # seconds offset from UTC
-        items = forecast_3h.get("list", [])
-
-        def local_day(dt_utc: int) -> date:
-            # Convert forecast timestamp (UTC) into the city's local date
-            return datetime.fromtimestamp(dt_utc + tz_offset, tz=timezone.utc).date()
-
-        grouped: Dict[date, List[Dict[str, Any]]] = {}
-        for item in items:
-            d = local_day(int(item["dt"]))
-            grouped.setdefault(d, []).append(item)
-
-        days: List[Dict[str, Any]] = []
-        for d in sorted(grouped.keys())[:5]:
-            steps = grouped[d]
-
-            # percent chance of precipitation for the day
-            pops = [
-                float(x["pop"])
-                for x in steps
-                if "pop" in x and x["pop"] is not None
-            ]
-
-            # Use average probability instead of max
-            pop_avg = sum(pops) / len(pops) if pops else None
-            pop_pct = round(pop_avg * 100) if pop_avg is not None else None
 
-            temps = [
-                float(x["main"]["temp"])
-                for x in steps
-                if "main" in x and "temp" in x["main"]
-            ]
-            tmin = min(temps) if temps else None
-            tmax = max(temps) if temps else None
-
-            # Find most frequent icon/description for that day
-            counts: Dict[Tuple[str, str], int] = {}
-            for x in steps:
-                w = (x.get("weather") or [{}])[0]
-                icon = w.get("icon", "")
-                desc = w.get("description", "")
-                counts[(icon, desc)] = counts.get((icon, desc), 0) + 1
-
-            (icon, desc) = max(counts.items(), key=lambda kv: kv[1])[0] if counts else ("", "")
-
-            days.append({
-                "date": d.isoformat(),  # keep existing ISO date
-                "dow": d.strftime("%a"),  # e.g., "Fri"
-                "date_display": d.strftime("%b %d, %Y"),  # e.g., "Dec 14, 2025"
-                "tmin": tmin,
-                "tmax": tmax,
-                "icon": icon,
-                "description": desc,
-                "pop_pct": pop_pct,
-            })
+        def steps():
+            for item in forecast_3h.get("list", []):
+                main = item.get("main")
+                weather = item.get("weather")
+                w = weather[0] if weather else _EMPTY_WEATHER
+                yield (
+                    int(item["dt"]),
+                    float(main["temp"]) if main and "temp" in main else None,
+                    item.get("pop"),
+                    w.get("icon", ""),
+                    w.get("description", ""),
+                )
 
-        return days
+        return _summarize_steps(steps(), tz_offset)
 
 
-class OpenMeteoClient:
+class OpenMeteoClient(_PooledHTTPClient):
     """
     Open-Meteo is used ONLY for Assessment 2's date-range daily min/max temperatures.
 
@@ -451,21 +774,19 @@ class OpenMeteoClient:
             "timezone": "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.get(self.base, params=params)
+        r = await self._http().get(self.base, params=params)
 
         if r.status_code != 200:
-            raise WeatherError(f"Open-Meteo daily temps failed ({r.status_code}): {r.text}")
+            _raise_http("Open-Meteo daily temps", r)
 
-        data = r.json()
+        data = orjson.loads(r.content)
         daily = data.get("daily") or {}
         dates = daily.get("time") or []
         tmax = daily.get("temperature_2m_max") or []
         tmin = daily.get("temperature_2m_min") or []
 
-        out: List[Dict[str, Any]] = []
-        for i in range(min(len(dates), len(tmax), len(tmin))):
-            out.append({"date": dates[i], "tmax": float(tmax[i]), "tmin": float(tmin[i])})
+        # zip stops at the shortest series, like the old min(len(...)) bound
+        out = [{"date": d, "tmax": float(mx), "tmin": float(mn)} for d, mx, mn in zip(dates, tmax, tmin)]
 
         if not out:
             raise WeatherError("No daily temperatures returned for that range.")